@@ -13,7 +13,7 @@ async def resource_weather_forecast(start_date: str, days: int):
     Returns:
         Weather forecast data from Open-Meteo API
     """
-    return get_weather_forecast(start_date, days)
+    return await get_weather_forecast(start_date, days)
 
 
 
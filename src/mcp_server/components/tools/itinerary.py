@@ -1,8 +1,8 @@
+import asyncio
 import json
 from fastmcp import Context
-from datetime import datetime
-from dateutil import parser
 from mcp_server.mcp_instance import mcp
+from mcp_server.utils.helpers import parse_date_input
 from mcp_server.utils.get_weather_forecast import get_activity_suggestions as get_suggestions
 from mcp_server.utils.elicitation import elicit_trip_extension
 from mcp_server.core.prompts.travel import get_itinerary_prompt, get_weather_based_activities_prompt
@@ -32,24 +32,23 @@ async def cox_ai_itinerary(ctx: Context, start_date: str, days: int, ) -> str:
         await ctx.error(f"Error: {str(e)}")
         return str(e)
     
-    # Parse start date
-    try:
-        start_date = parser.parse(start_date)
-    except Exception:
-        start_date = datetime.today()
-
-    # Get weather forecast
-    read_weather_forecast = await ctx.read_resource(f"weather://coxsbazar/forecast/{start_date.strftime('%Y-%m-%d')}/{days}")
+    # Parse start date (fast-paths "today" and ISO-8601, cached per string)
+    start_date = parse_date_input(start_date)
+
+    # Fetch the weather forecast and generate the base itinerary prompt
+    # concurrently - they are independent, so latency is max() not sum()
+    read_weather_forecast, base_prompt = await asyncio.gather(
+        ctx.read_resource(f"weather://coxsbazar/forecast/{start_date.strftime('%Y-%m-%d')}/{days}"),
+        get_itinerary_prompt(days, start_date),
+    )
     weather_data = json.loads(read_weather_forecast[0].content)
-    
-    # Generate base itinerary prompt
-    base_prompt = await get_itinerary_prompt(days, start_date)
-    
-    # Generate weather-based activities prompt
+
+    # Generate weather-based activities prompt (depends on the forecast)
     weather_prompt = await get_weather_based_activities_prompt(weather_data)
     
-    # Format output
-    output = f"""# Cox's Bazar Itinerary Planning
+    # Format output - collect markdown chunks and join once instead of
+    # growing a string with += per forecast day
+    chunks = [f"""# Cox's Bazar Itinerary Planning
 
 ## Trip Details
 - **Location:** {weather_data['location']}
@@ -59,11 +58,11 @@ async def cox_ai_itinerary(ctx: Context, start_date: str, days: int, ) -> str:
 
 ## Weather Forecast
 
-"""
-    
+"""]
+
     # Add detailed forecast
     for day in weather_data['forecast']:
-        output += f"""### Day {day['day']} - {day['date']}
+        chunks.append(f"""### Day {day['day']} - {day['date']}
 - **Weather:** {day['weather']}
 - **Temperature:** {day['temp_min']}°C - {day['temp_max']}°C (Average: {day['temp_avg']}°C)
 - **Precipitation:** {day['precipitation']}mm
@@ -71,24 +70,24 @@ async def cox_ai_itinerary(ctx: Context, start_date: str, days: int, ) -> str:
 - **Sunrise:** {day['sunrise']} | **Sunset:** {day['sunset']}
 
 **Activity Suggestions:**
-"""
-        
+""")
+
         # Get activity suggestions for different times
         temp_avg = day['temp_avg']
         morning_activities = get_suggestions(temp_avg - 2, "morning")
         afternoon_activities = get_suggestions(temp_avg, "afternoon")
         evening_activities = get_suggestions(temp_avg, "evening")
-        
-        output += f"""
+
+        chunks.append(f"""
 - **Morning:** {', '.join(morning_activities[:2])}
 - **Afternoon:** {', '.join(afternoon_activities[:2])}
 - **Evening:** {', '.join(evening_activities[:2])}
 
 {elicitation_note}
 
-"""
-    
-    output += f"""
+""")
+
+    chunks.append(f"""
 ---
 
 ## AI Itinerary Generation Prompt
@@ -104,9 +103,9 @@ async def cox_ai_itinerary(ctx: Context, start_date: str, days: int, ) -> str:
 ---
 
 **Note:** Use the above prompts with an AI assistant to generate a detailed, personalized itinerary based on the weather forecast and your preferences.
-"""
-    
-    return output
+""")
+
+    return "".join(chunks)
 
 
 @mcp.tool(
@@ -1,19 +1,32 @@
-import os
+import logging
+from functools import lru_cache
 from fastmcp.server.auth.providers.github import GitHubProvider
 from key_value.aio.stores.redis import RedisStore
+from mcp_server.config.env import get_env
 
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=4)
 def get_auth_provider(provider_name: str):
-  """Get the auth provider based on the provider name."""
+  """
+  Get the auth provider based on the provider name.
+
+  Memoized so the GitHubProvider and its RedisStore are constructed once
+  per process - repeat calls reuse the same instances (and the same Redis
+  connection) instead of paying a fresh connection handshake.
+  """
   if provider_name.lower() == "github":
+    env = get_env()
+
     # Get Redis configuration
-    redis_host = os.getenv("REDIS_HOST", "localhost")
-    redis_port = int(os.getenv("REDIS_PORT", "6379"))
-    redis_password = os.getenv("REDIS_PASSWORD")
-    
+    redis_host = env["REDIS_HOST"] or "localhost"
+    redis_port = int(env["REDIS_PORT"] or "6379")
+    redis_password = env["REDIS_PASSWORD"]
+
     # Get GitHub configuration
-    github_client_id = os.getenv("GITHUB_CLIENT_ID")
-    github_client_secret = os.getenv("GITHUB_CLIENT_SECRET")
-    base_url = os.getenv("RESOURCE_BASE_URL", "http://localhost:8000")
+    github_client_id = env["GITHUB_CLIENT_ID"]
+    github_client_secret = env["GITHUB_CLIENT_SECRET"]
+    base_url = env["RESOURCE_BASE_URL"] or "http://localhost:8000"
     
     # Validate required configuration
     if not github_client_id or not github_client_secret:
@@ -29,7 +42,7 @@ def get_auth_provider(provider_name: str):
       db=0
     )
     
-    print(f"✓ Initializing GitHub OAuth with Redis storage at {redis_host}:{redis_port}")
+    logger.info("Initializing GitHub OAuth with Redis storage at %s:%s", redis_host, redis_port)
     
     return GitHubProvider(
       client_id=github_client_id,
@@ -1,16 +1,30 @@
+import hashlib
+import json
 from mcp_server.mcp_instance import mcp
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import Response
+
+# Both endpoints return fully static payloads, so serialize and UTF-8
+# encode them once at import instead of on every request
+_ROOT_BODY = json.dumps({
+    "message": "Hello, World!",
+    "service": "Cox's Bazar AI Itinerary MCP Server",
+    "status": "running"
+}).encode("utf-8")
+_HEALTH_BODY = b"OK"
+
+# Precomputed validator for the root payload - polling clients that send
+# If-None-Match get an empty 304 instead of the body on every refresh
+_ROOT_ETAG = '"' + hashlib.blake2b(_ROOT_BODY, digest_size=16).hexdigest() + '"'
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "private, max-age=30"}
 
 @mcp.custom_route("/", methods=["GET"])
 async def root(request):
     """Root endpoint for health check."""
-    return JSONResponse({
-        "message": "Hello, World!",
-        "service": "Cox's Bazar AI Itinerary MCP Server",
-        "status": "running"
-    })
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS)
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health(request):
     """Health check endpoint."""
-    return PlainTextResponse("OK")
\ No newline at end of file
+    return Response(content=_HEALTH_BODY, media_type="text/plain")
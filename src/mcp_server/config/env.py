@@ -0,0 +1,35 @@
+"""Cached environment configuration for the MCP server."""
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from dotenv import load_dotenv
+
+# Every environment variable the server reads, in one place
+_ENV_KEYS = (
+    "IS_OAUTH_ENABLED",
+    "TRANSPORT_NAME",
+    "SERVER_PORT",
+    "SERVER_HOST",
+    "REDIS_HOST",
+    "REDIS_PORT",
+    "REDIS_PASSWORD",
+    "GITHUB_CLIENT_ID",
+    "GITHUB_CLIENT_SECRET",
+    "RESOURCE_BASE_URL",
+    "LOG_LEVEL",
+)
+
+
+@lru_cache(maxsize=1)
+def get_env() -> MappingProxyType:
+    """
+    Load .env once and return a read-only snapshot of the server settings.
+
+    Parsing the dotenv file and walking os.environ happens a single time per
+    process; every caller afterwards reads from the cached frozen mapping.
+
+    Returns:
+        Read-only mapping of the known configuration keys (missing -> None)
+    """
+    load_dotenv()
+    return MappingProxyType({key: os.environ.get(key) for key in _ENV_KEYS})
@@ -72,15 +72,17 @@ async def get_weather_based_activities_prompt(weather_data: Dict[str, Any]) -> s
     days = weather_data.get('days', 0)
     start_date = weather_data.get('start_date', 'N/A')
     
-    prompt = f"""Based on the weather forecast for Cox's Bazar, suggest optimal activities for each day:
+    # Collect lines in a list and join once at the end; repeated `prompt += ...`
+    # is quadratic in the worst case and churns temporary strings.
+    parts = [f"""Based on the weather forecast for Cox's Bazar, suggest optimal activities for each day:
 
 Location: {location}
 Trip Duration: {days} days
 Start Date: {start_date}
 
 Daily Weather Summary:
-"""
-    
+"""]
+
     for day in forecast:
         day_num = day.get('day', 0)
         date = day.get('date', 'N/A')
@@ -92,15 +94,15 @@ Daily Weather Summary:
         windspeed = day.get('windspeed', 0)
         sunrise = day.get('sunrise', 'N/A')
         sunset = day.get('sunset', 'N/A')
-        
-        prompt += f"\nDay {day_num} ({date}):\n"
-        prompt += f"- Weather: {weather}\n"
-        prompt += f"- Temperature: {temp_min}°C - {temp_max}°C (Avg: {temp_avg}°C)\n"
-        prompt += f"- Precipitation: {precipitation}mm\n"
-        prompt += f"- Wind Speed: {windspeed} km/h\n"
-        prompt += f"- Sunrise: {sunrise} | Sunset: {sunset}\n"
-    
-    prompt += """
+
+        parts.append(f"\nDay {day_num} ({date}):\n")
+        parts.append(f"- Weather: {weather}\n")
+        parts.append(f"- Temperature: {temp_min}°C - {temp_max}°C (Avg: {temp_avg}°C)\n")
+        parts.append(f"- Precipitation: {precipitation}mm\n")
+        parts.append(f"- Wind Speed: {windspeed} km/h\n")
+        parts.append(f"- Sunrise: {sunrise} | Sunset: {sunset}\n")
+
+    parts.append("""
 Based on this weather forecast, please provide:
 1. Best activities for each day considering the weather conditions
 2. Time-specific recommendations (morning/afternoon/evening)
@@ -108,6 +110,6 @@ Based on this weather forecast, please provide:
 4. Optimal times for beach activities
 5. Photography opportunities (sunrise/sunset)
 6. Dining suggestions based on weather
-"""
-    
-    return prompt
\ No newline at end of file
+""")
+
+    return "".join(parts)
\ No newline at end of file
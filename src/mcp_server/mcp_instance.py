@@ -1,21 +1,23 @@
-import os
 from fastmcp import FastMCP
-from mcp_server.config.auth_provider import get_auth_provider
-from dotenv import load_dotenv
+from mcp_server.config.env import get_env
 
 
-load_dotenv()
+env = get_env()
 
-is_oauth_enabled = os.environ.get("IS_OAUTH_ENABLED") == "true"
-# Configuration for MCP initialization
-mcp_config_context = {
-    "name": "Cox's Bazar AI Itinerary MCP",
-}
+is_oauth_enabled = env["IS_OAUTH_ENABLED"] == "true"
 
-# Add auth if OAuth is enabled
 if is_oauth_enabled:
-    mcp_config_context["auth"] = get_auth_provider("github")
+    # Imported lazily: the GitHub provider drags in the redis client stack,
+    # which stdio deployments without OAuth never need at import time
+    from mcp_server.config.auth_provider import get_auth_provider
 
+# Configuration for MCP initialization, built in a single expression; the
+# auth key only exists (and the provider is only constructed) when OAuth
+# is enabled
+mcp_config_context = {
+    "name": "Cox's Bazar AI Itinerary MCP",
+    **({"auth": get_auth_provider("github")} if is_oauth_enabled else {}),
+}
 
 # Initialize FastMCP with valid parameters only
 mcp = FastMCP(**mcp_config_context)
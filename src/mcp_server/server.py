@@ -1,6 +1,6 @@
 """Main FastMCP server for Cox's Bazar AI Itinerary."""
+import logging
 import sys
-import os
 from pathlib import Path
 # Add src directory to path if running directly
 if __name__ == "__main__" or "mcp_server" not in sys.modules:
@@ -8,20 +8,25 @@ if __name__ == "__main__" or "mcp_server" not in sys.modules:
     if str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
 
-from dotenv import load_dotenv
+from mcp_server.config.env import get_env
 from mcp_server.utils.register_mcp_components import register_mcp_components
 from mcp_server.mcp_instance import mcp
 
 
-load_dotenv()
-
-
-
 def main():
     """Run the MCP server."""
-    transport_name = os.environ.get("TRANSPORT_NAME") or "stdio"
-    server_port = int(os.environ.get("SERVER_PORT") or 8000)
-    server_host = os.environ.get("SERVER_HOST") or "0.0.0.0"
+    env = get_env()
+
+    # Log to stderr only - stdout is reserved for the stdio transport's
+    # JSON-RPC framing, so nothing may print there
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=env["LOG_LEVEL"] or "INFO",
+    )
+
+    transport_name = env["TRANSPORT_NAME"] or "stdio"
+    server_port = int(env["SERVER_PORT"] or 8000)
+    server_host = env["SERVER_HOST"] or "0.0.0.0"
 
     #Auto-register all MCP components (tools, prompts, resources)
     base_dir = Path(__file__).parent
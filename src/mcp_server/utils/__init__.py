@@ -1,5 +1,6 @@
 """Utility functions."""
 from mcp_server.utils.helpers import (
+    parse_date_input,
     format_date,
     validate_days,
     format_temperature,
@@ -7,6 +8,7 @@ from mcp_server.utils.helpers import (
 from mcp_server.utils.register_mcp_components import register_mcp_components
 
 __all__ = [
+    "parse_date_input",
     "format_date",
     "validate_days",
     "format_temperature",
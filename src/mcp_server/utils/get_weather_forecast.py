@@ -1,17 +1,77 @@
 """Weather forecast utility using Open-Meteo API."""
+# NOTE: this module is I/O-bound (Open-Meteo HTTPS round-trips) and
+# string/dict-bound (building JSON-shaped forecasts) - not numeric. A JIT such
+# as Numba would fall back to object mode here and run slower than CPython.
+# Optimizations belong in async I/O, connection pooling, and caching, not in
+# compilation.
 
-import requests
+import logging
+import threading
+import time
+import httpx
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
-from dateutil import parser
+from urllib.parse import urlencode
+from mcp_server.utils.helpers import parse_date_input
 
 
 # Cox's Bazar coordinates
 COX_BAZAR_LAT = 21.4272
 COX_BAZAR_LON = 92.0058
 
+# Open-Meteo endpoint and the daily variables we request
+API_BASE_URL = "https://api.open-meteo.com/v1/forecast"
+DAILY_FIELDS = "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode,windspeed_10m_max,sunrise,sunset"
 
-def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
+logger = logging.getLogger(__name__)
+
+# WMO weather code -> human-readable description
+WEATHER_CODE_DESCRIPTIONS = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+}
+
+# Short-lived cache of successful API responses keyed by the request URL.
+# The daily forecast barely changes minute-to-minute, so repeated resource
+# hits within the TTL skip the full HTTPS round-trip.
+_WX_CACHE: Dict[str, tuple] = {}
+_WX_CACHE_LOCK = threading.Lock()
+_WX_TTL = 600  # seconds
+
+# Shared async client so the TCP+TLS connection to api.open-meteo.com is
+# pooled and reused across calls, and so the fetch does not block the
+# asyncio event loop serving concurrent MCP requests.
+_CLIENT = httpx.AsyncClient(
+    timeout=10.0,
+    headers={"User-Agent": "coxs-bazar-mcp/1.0"},
+    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+)
+
+
+async def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
     """
     Fetch weather forecast from Open-Meteo API for Cox's Bazar.
     
@@ -25,41 +85,43 @@ def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
     Raises:
         Exception: If API request fails
     """
-    # Parse start date
-    try:
-        if start_date.lower() == "today":
-            start_dt = datetime.today()
-        else:
-            start_dt = parser.parse(start_date)
-    except Exception:
-        start_dt = datetime.today()
-    
+    # Parse start date (fast-paths "today" and ISO-8601)
+    start_dt = parse_date_input(start_date)
+
     # Calculate end date
     end_dt = start_dt + timedelta(days=days - 1)
     
     # Format dates for API (YYYY-MM-DD)
     start_date_str = start_dt.strftime("%Y-%m-%d")
     end_date_str = end_dt.strftime("%Y-%m-%d")
-    
-    # Build API URL
-    base_url = "https://api.open-meteo.com/v1/forecast"
-    params = {
+
+    # Build the full request URL in one urlencode pass; it encodes every
+    # parameter properly and doubles as a stable cache key
+    url = API_BASE_URL + "?" + urlencode({
         "latitude": COX_BAZAR_LAT,
         "longitude": COX_BAZAR_LON,
-        "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode,windspeed_10m_max,sunrise,sunset",
+        "daily": DAILY_FIELDS,
         "timezone": "Asia/Dhaka",
         "start_date": start_date_str,
         "end_date": end_date_str
-    }
-    
+    })
+
+    # Serve recent results from the cache before hitting the network
+    cache_key = url
+    now = time.monotonic()
+    with _WX_CACHE_LOCK:
+        cached = _WX_CACHE.get(cache_key)
+        if cached is not None and now - cached[0] < _WX_TTL:
+            return cached[1]
+
     try:
-        response = requests.get(base_url, params=params, timeout=10)
+        response = await _CLIENT.get(url)
         response.raise_for_status()
         data = response.json()
         
         # Debug: Check if API returned an error
         if "error" in data:
-            print(f"⚠️  Open-Meteo API error: {data.get('reason', 'Unknown error')}. Using fallback data.")
+            logger.warning("Open-Meteo API error: %s. Using fallback data.", data.get("reason", "Unknown error"))
             return get_fallback_forecast(start_date_str, end_date_str, days)
         
         # Parse the forecast data
@@ -73,27 +135,45 @@ def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
         sunrise = daily.get("sunrise", [])
         sunset = daily.get("sunset", [])
         
-        # Build forecast list
+        # Round each numeric series in a single pass up front so the loop
+        # below only indexes pre-rounded values. Hoist lookups that are
+        # invariant across iterations (the description table's .get and the
+        # list lengths) into locals so the loop body touches locals only.
+        temp_max_r = [round(t, 1) for t in temp_max]
+        temp_min_r = [round(t, 1) for t in temp_min]
+        temp_avg_r = [round((hi + lo) / 2, 1) for hi, lo in zip(temp_max, temp_min)]
+        precipitation_r = [round(p, 1) for p in precipitation]
+        windspeed_r = [round(w, 1) for w in windspeed]
+
+        wc_get = WEATHER_CODE_DESCRIPTIONS.get
+        n_max = len(temp_max_r)
+        n_min = len(temp_min_r)
+        n_avg = len(temp_avg_r)
+        n_pr = len(precipitation_r)
+        n_wc = len(weathercodes)
+        n_ws = len(windspeed_r)
+        n_sr = len(sunrise)
+        n_ss = len(sunset)
+
         forecast = []
         for i in range(len(dates)):
-            # Convert weather code to description
-            weather_desc = get_weather_description(weathercodes[i] if i < len(weathercodes) else 0)
-            
+            weathercode = weathercodes[i] if i < n_wc else 0
+
             forecast.append({
                 "day": i + 1,
                 "date": dates[i],
-                "temp_max": round(temp_max[i], 1) if i < len(temp_max) else None,
-                "temp_min": round(temp_min[i], 1) if i < len(temp_min) else None,
-                "temp_avg": round((temp_max[i] + temp_min[i]) / 2, 1) if i < len(temp_max) and i < len(temp_min) else None,
-                "precipitation": round(precipitation[i], 1) if i < len(precipitation) else 0,
-                "weather": weather_desc,
-                "weathercode": weathercodes[i] if i < len(weathercodes) else 0,
-                "windspeed": round(windspeed[i], 1) if i < len(windspeed) else None,
-                "sunrise": sunrise[i].split("T")[1] if i < len(sunrise) else None,
-                "sunset": sunset[i].split("T")[1] if i < len(sunset) else None,
+                "temp_max": temp_max_r[i] if i < n_max else None,
+                "temp_min": temp_min_r[i] if i < n_min else None,
+                "temp_avg": temp_avg_r[i] if i < n_avg else None,
+                "precipitation": precipitation_r[i] if i < n_pr else 0,
+                "weather": wc_get(weathercode, "Unknown"),
+                "weathercode": weathercode,
+                "windspeed": windspeed_r[i] if i < n_ws else None,
+                "sunrise": sunrise[i].split("T")[1] if i < n_sr else None,
+                "sunset": sunset[i].split("T")[1] if i < n_ss else None,
             })
         
-        return {
+        result = {
             "location": "Cox's Bazar, Bangladesh",
             "coordinates": {"latitude": COX_BAZAR_LAT, "longitude": COX_BAZAR_LON},
             "start_date": start_date_str,
@@ -102,10 +182,16 @@ def get_weather_forecast(start_date: str, days: int) -> Dict[str, Any]:
             "timezone": "Asia/Dhaka",
             "forecast": forecast
         }
-        
+
+        # Only successful fetches are cached; fallback data is not
+        with _WX_CACHE_LOCK:
+            _WX_CACHE[cache_key] = (time.monotonic(), result)
+
+        return result
+
     except Exception as e:
         # Fallback to mock data if API fails
-        print(f"⚠️  Open-Meteo API error: {e}. Using fallback data.")
+        logger.warning("Open-Meteo API error: %s. Using fallback data.", e)
         return get_fallback_forecast(start_date_str, end_date_str, days)
 
 
@@ -119,39 +205,18 @@ def get_weather_description(weathercode: int) -> str:
     Returns:
         Human-readable weather description
     """
-    weather_codes = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Foggy",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        71: "Slight snow",
-        73: "Moderate snow",
-        75: "Heavy snow",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail"
-    }
-    return weather_codes.get(weathercode, "Unknown")
+    return WEATHER_CODE_DESCRIPTIONS.get(weathercode, "Unknown")
 
 
+@lru_cache(maxsize=32)
 def get_fallback_forecast(start_date: str, end_date: str, days: int) -> Dict[str, Any]:
     """
     Provide fallback forecast data when API is unavailable.
-    
+
+    The mock data is fully determined by its arguments, so results are
+    memoized - when Open-Meteo is down, repeated resource hits reuse the
+    built dict instead of regenerating it. Callers treat it as read-only.
+
     Args:
         start_date: Start date string (YYYY-MM-DD)
         end_date: End date string (YYYY-MM-DD)
@@ -162,19 +227,21 @@ def get_fallback_forecast(start_date: str, end_date: str, days: int) -> Dict[str
     """
     forecast = []
     base_temp = 28
-    
-    # Parse start date to generate proper dates for each day
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    
+
+    # Parse start date to generate proper dates for each day.
+    # Step the date with a single reusable timedelta instead of building a
+    # fresh timedelta + strftime pair per iteration.
+    current_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
+    one_day = timedelta(days=1)
+
     for i in range(days):
-        current_date = start_dt + timedelta(days=i)
         temp_variation = (i % 3) - 1  # Creates variation: -1, 0, 1
         temp_max = base_temp + 2 + temp_variation
         temp_min = base_temp - 3 + temp_variation
-        
+
         forecast.append({
             "day": i + 1,
-            "date": current_date.strftime("%Y-%m-%d"),
+            "date": current_dt.strftime("%Y-%m-%d"),
             "temp_max": temp_max,
             "temp_min": temp_min,
             "temp_avg": round((temp_max + temp_min) / 2, 1),
@@ -185,7 +252,8 @@ def get_fallback_forecast(start_date: str, end_date: str, days: int) -> Dict[str
             "sunrise": "06:00",
             "sunset": "18:00",
         })
-    
+        current_dt += one_day
+
     return {
         "location": "Cox's Bazar, Bangladesh",
         "coordinates": {"latitude": COX_BAZAR_LAT, "longitude": COX_BAZAR_LON},
@@ -198,59 +266,64 @@ def get_fallback_forecast(start_date: str, end_date: str, days: int) -> Dict[str
     }
 
 
+# Activity suggestion tables, built once at import. Tuples keep them
+# immutable so they can be returned from the memoized selector directly.
+_MORNING_COOL = (
+    "Beach walk and photography",
+    "Visit Himchari National Park",
+    "Sunrise at Laboni Beach",
+    "Morning yoga on the beach",
+)
+_MORNING_WARM = (
+    "Early morning swim",
+    "Sunrise boat ride",
+    "Visit Inani Beach",
+    "Morning market exploration",
+)
+_AFTERNOON_MILD = (
+    "Visit Aggameda Khyang monastery",
+    "Explore Ramu Buddhist Village",
+    "Maheshkhali Island tour",
+    "Marine Drive scenic route",
+)
+_AFTERNOON_HOT = (
+    "Indoor activities - shopping at local markets",
+    "Visit Bangabandhu Safari Park",
+    "Relax at beach resorts",
+    "Water sports activities",
+)
+_EVENING = (
+    "Sunset at Sugandha Beach",
+    "Seafood dinner at local restaurants",
+    "Beach bonfire",
+    "Night market shopping",
+    "Cultural performances",
+)
+
+
 def get_activity_suggestions(temperature: float, time_of_day: str = "afternoon") -> List[str]:
     """
     Suggest activities based on temperature and time of day.
-    
+
     Args:
         temperature: Temperature in Celsius
         time_of_day: "morning", "afternoon", or "evening"
-    
+
     Returns:
         List of suggested activities
     """
-    suggestions = []
-    
+    # Suggestions only depend on a coarse temperature bucket, so memoize on
+    # the rounded degree - repeated temperatures across forecast days become
+    # a cache hit instead of rebuilding the lists
+    return list(_cached_activity_suggestions(int(round(temperature)), time_of_day))
+
+
+@lru_cache(maxsize=256)
+def _cached_activity_suggestions(temperature: int, time_of_day: str) -> tuple:
+    """Memoized backend for get_activity_suggestions (whole-degree buckets)."""
     if time_of_day == "morning":
-        if temperature < 28:
-            suggestions = [
-                "Beach walk and photography",
-                "Visit Himchari National Park",
-                "Sunrise at Laboni Beach",
-                "Morning yoga on the beach"
-            ]
-        else:
-            suggestions = [
-                "Early morning swim",
-                "Sunrise boat ride",
-                "Visit Inani Beach",
-                "Morning market exploration"
-            ]
-    
-    elif time_of_day == "afternoon":
-        if temperature < 30:
-            suggestions = [
-                "Visit Aggameda Khyang monastery",
-                "Explore Ramu Buddhist Village",
-                "Maheshkhali Island tour",
-                "Marine Drive scenic route"
-            ]
-        else:
-            suggestions = [
-                "Indoor activities - shopping at local markets",
-                "Visit Bangabandhu Safari Park",
-                "Relax at beach resorts",
-                "Water sports activities"
-            ]
-    
-    else:  # evening
-        suggestions = [
-            "Sunset at Sugandha Beach",
-            "Seafood dinner at local restaurants",
-            "Beach bonfire",
-            "Night market shopping",
-            "Cultural performances"
-        ]
-    
-    return suggestions
+        return _MORNING_COOL if temperature < 28 else _MORNING_WARM
+    if time_of_day == "afternoon":
+        return _AFTERNOON_MILD if temperature < 30 else _AFTERNOON_HOT
+    return _EVENING
 
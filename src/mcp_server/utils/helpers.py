@@ -1,25 +1,85 @@
 """Helper utility functions."""
+from bisect import bisect_right
 from datetime import datetime
-from dateutil import parser
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# The whole service is pinned to Cox's Bazar time (the forecast API is
+# queried with timezone=Asia/Dhaka), so "today" must be today *there*,
+# not on the host clock. Build the ZoneInfo once - constructing it per
+# call would re-read the tz database.
+_DHAKA_TZ = ZoneInfo("Asia/Dhaka")
+
+
+def _today() -> datetime:
+    """Current datetime in Cox's Bazar local time, returned naive."""
+    return datetime.now(_DHAKA_TZ).replace(tzinfo=None)
+
+
+# Explicit fallback formats for the non-ISO shapes users actually send.
+# These replace dateutil's general-purpose parser, which was this repo's
+# only reason to carry the python-dateutil dependency.
+_DATE_FORMATS = ("%d %b %Y", "%d %B %Y", "%b %d, %Y", "%B %d, %Y", "%d/%m/%Y")
+
+
+@lru_cache(maxsize=64)
+def _parse_date_string(date_str: str) -> datetime:
+    """Parse a date string, trying the C-implemented ISO parser first."""
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized date format: {date_str!r}")
+
+def parse_date_input(date_str: str) -> datetime:
+    """
+    Parse a user-supplied date string into a datetime.
+
+    Fast-paths the common inputs: "today" resolves to the current date and
+    ISO-8601 strings go through datetime.fromisoformat; anything else falls
+    back to a small set of explicit strptime formats, with successful
+    parses cached.
+
+    Args:
+        date_str: Input date string (e.g., "2025-01-15", "15 Jan 2025", "today")
+
+    Returns:
+        Parsed datetime (today's date if the input is unparseable)
+    """
+    try:
+        if date_str.lower() == "today":
+            return _today()
+        return _parse_date_string(date_str)
+    except Exception:
+        return _today()
 
 def format_date(date_str: str) -> str:
     """
     Format date string to standard format.
-    
+
+    Goes through the same cached ISO fast-path parser as parse_date_input,
+    so re-formatting the handful of date strings a forecast produces does
+    not re-run the strptime fallback loop each time.
+
     Args:
         date_str: Input date string
-    
+
     Returns:
         Formatted date string (DD MMM YYYY)
     """
     try:
         if date_str.lower() == "today":
-            dt = datetime.today()
+            dt = _today()
         else:
-            dt = parser.parse(date_str)
+            dt = _parse_date_string(date_str)
         return dt.strftime("%d %b %Y")
     except Exception:
-        return datetime.today().strftime("%d %b %Y")
+        return _today().strftime("%d %b %Y")
 
 def validate_days(days: int) -> int:
     """
@@ -31,35 +91,26 @@ def validate_days(days: int) -> int:
     Returns:
         Validated number of days (1-14)
     """
-    if days < 1:
-        return 1
-    elif days > 14:
-        return 14
-    return days
+    return max(1, min(14, days))
+
+# Temperature description bands: desc[i] applies below thresholds[i],
+# with the last description covering everything above
+_TEMP_THRESHOLDS = (20, 25, 30, 35)
+_TEMP_DESCS = ("Cool", "Pleasant", "Warm", "Hot", "Very Hot")
 
 def format_temperature(temp: float) -> str:
     """
     Format temperature with appropriate description.
-    
+
     Args:
         temp: Temperature in Celsius
-    
+
     Returns:
         Formatted temperature string with description
     """
-    temp_str = f"{temp:.1f}°C"
-    
-    if temp < 20:
-        desc = "Cool"
-    elif temp < 25:
-        desc = "Pleasant"
-    elif temp < 30:
-        desc = "Warm"
-    elif temp < 35:
-        desc = "Hot"
-    else:
-        desc = "Very Hot"
-    
-    return f"{temp_str} ({desc})"
+    # One C-level binary search into the bands table instead of an
+    # if/elif chain of float comparisons
+    desc = _TEMP_DESCS[bisect_right(_TEMP_THRESHOLDS, temp)]
+    return f"{temp:.1f}°C ({desc})"
 
 
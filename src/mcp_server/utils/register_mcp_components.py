@@ -5,8 +5,47 @@ Automatically discovers and imports all tools, prompts, and resources
 from their respective component directories.
 """
 import importlib
+import logging
+from functools import lru_cache
 from pathlib import Path
 
+# Logging instead of print(): stdout belongs to the stdio transport's
+# JSON-RPC framing, and %s-style lazy formatting means the per-component
+# DEBUG lines cost nothing when the level filters them out
+logger = logging.getLogger(__name__)
+
+# Set once registration has run; repeat calls (hot reload, tests importing
+# server twice) must not re-walk the components directory
+_registered = False
+
+
+@lru_cache(maxsize=1)
+def _component_manifest(components_dir: Path) -> tuple:
+    """
+    Discover component modules with a single filesystem walk per process.
+
+    Returns a tuple of (component_type, module_names) pairs so callers can
+    import from the cached manifest instead of re-globbing the components
+    directory on every invocation.
+    """
+    manifest = []
+
+    for component_type in ("tools", "prompts", "resources"):
+        component_path = components_dir / component_type
+
+        if not component_path.exists():
+            logger.warning("%s directory not found at %s", component_type, component_path)
+            continue
+
+        module_names = tuple(
+            f"mcp_server.components.{component_type}.{f.stem}"
+            for f in sorted(component_path.glob("*.py"))
+            if f.name != "__init__.py" and not f.name.startswith("_")
+        )
+        manifest.append((component_type, module_names))
+
+    return tuple(manifest)
+
 
 def register_mcp_components(base_dir: Path, transport: str = "stdio") -> None:
     """
@@ -21,38 +60,28 @@ def register_mcp_components(base_dir: Path, transport: str = "stdio") -> None:
         base_dir: Base directory of the MCP server (usually Path(__file__).parent from server.py)
         transport: Transport type (default: "stdio"). If not "stdio", custom routes will be registered.
     """
+    global _registered
+    if _registered:
+        return
+    _registered = True
+
     components_dir = base_dir / "components"
-    component_types = ["tools", "prompts", "resources"]
-    
+
     registered_count = {
         "tools": 0,
         "prompts": 0,
         "resources": 0
     }
-    
-    for component_type in component_types:
-        component_path = components_dir / component_type
-        
-        if not component_path.exists():
-            print(f"Warning: {component_type} directory not found at {component_path}")
-            continue
-        
-        # Find all Python files in the component directory
-        python_files = [
-            f for f in component_path.glob("*.py")
-            if f.name != "__init__.py" and not f.name.startswith("_")
-        ]
-        
-        for py_file in python_files:
-            module_name = f"mcp_server.components.{component_type}.{py_file.stem}"
-            
+
+    for component_type, module_names in _component_manifest(components_dir):
+        for module_name in module_names:
             try:
                 # Import the module (this triggers the decorators)
                 importlib.import_module(module_name)
                 registered_count[component_type] += 1
-                print(f"Registered {component_type[:-1]}: {py_file.stem}")
+                logger.debug("Registered %s: %s", component_type[:-1], module_name.rsplit(".", 1)[1])
             except Exception as e:
-                print(f"Error importing {module_name}: {e}")
+                logger.warning("Error importing %s: %s", module_name, e)
                 # Continue with other modules even if one fails
                 continue
     
@@ -64,18 +93,19 @@ def register_mcp_components(base_dir: Path, transport: str = "stdio") -> None:
             
             if custom_routes_file.exists():
                 importlib.import_module("mcp_server.config.custom_routes")
-                print(f"Registered custom routes (transport: {transport})")
+                logger.debug("Registered custom routes (transport: %s)", transport)
             else:
-                print(f"Warning: Custom routes file not found at {custom_routes_file}")
+                logger.warning("Custom routes file not found at %s", custom_routes_file)
         except Exception as e:
-            print(f"Error importing custom routes: {e}")
+            logger.warning("Error importing custom routes: %s", e)
     
-    # Print summary
-    print("\nRegistration Summary:")
-    print(f"Tools: {registered_count['tools']}")
-    print(f"Prompts: {registered_count['prompts']}")
-    print(f"Resources: {registered_count['resources']}")
-    if transport.lower() != "stdio":
-        print("Custom Routes: Enabled")
-    print(f"Total: {sum(registered_count.values())} components registered\n")
+    # Log summary
+    logger.info(
+        "Registered %d components (tools: %d, prompts: %d, resources: %d%s)",
+        sum(registered_count.values()),
+        registered_count["tools"],
+        registered_count["prompts"],
+        registered_count["resources"],
+        ", custom routes enabled" if transport.lower() != "stdio" else "",
+    )
 
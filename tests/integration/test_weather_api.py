@@ -1,22 +1,30 @@
 """Integration tests for weather API interactions."""
 import pytest
 from unittest.mock import Mock, patch
-from mcp_server.utils.get_weather_forecast import get_weather_forecast
+from mcp_server.utils.get_weather_forecast import get_weather_forecast, _WX_CACHE
+
+
+@pytest.fixture(autouse=True)
+def clear_weather_cache():
+    """Clear the TTL response cache so each test hits the mocked API."""
+    _WX_CACHE.clear()
+    yield
+    _WX_CACHE.clear()
 
 
 @pytest.mark.integration
 class TestWeatherForecastAPI:
     """Test weather forecast API integration and error handling."""
-    
-    @patch("mcp_server.utils.get_weather_forecast.requests.get")
-    def test_successful_forecast(self, mock_get, mock_open_meteo_response):
+
+    @patch("mcp_server.utils.get_weather_forecast._CLIENT.get")
+    async def test_successful_forecast(self, mock_get, mock_open_meteo_response):
         """Test successful weather forecast retrieval from API."""
         mock_response = Mock()
         mock_response.json.return_value = mock_open_meteo_response
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
-        result = get_weather_forecast("2025-01-15", 3)
+        result = await get_weather_forecast("2025-01-15", 3)
         
         assert result["location"] == "Cox's Bazar, Bangladesh"
         assert result["days"] == 3
@@ -26,8 +34,8 @@ class TestWeatherForecastAPI:
         assert "temp_min" in result["forecast"][0]
         assert "temp_avg" in result["forecast"][0]
     
-    @patch("mcp_server.utils.get_weather_forecast.requests.get")
-    def test_api_error_response(self, mock_get):
+    @patch("mcp_server.utils.get_weather_forecast._CLIENT.get")
+    async def test_api_error_response(self, mock_get):
         """Test handling of API error responses."""
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -37,25 +45,25 @@ class TestWeatherForecastAPI:
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
-        result = get_weather_forecast("2025-01-15", 3)
+        result = await get_weather_forecast("2025-01-15", 3)
         
         # Should fallback to mock data
         assert "note" in result or result["days"] == 3
     
-    @patch("mcp_server.utils.get_weather_forecast.requests.get")
-    def test_api_request_failure(self, mock_get):
+    @patch("mcp_server.utils.get_weather_forecast._CLIENT.get")
+    async def test_api_request_failure(self, mock_get):
         """Test handling of network failures."""
         mock_get.side_effect = Exception("Network error")
         
-        result = get_weather_forecast("2025-01-15", 3)
+        result = await get_weather_forecast("2025-01-15", 3)
         
         # Should fallback to mock data
         assert result["days"] == 3
         assert len(result["forecast"]) == 3
     
-    def test_today_date_parsing(self):
+    async def test_today_date_parsing(self):
         """Test parsing 'today' as start date parameter."""
-        with patch("mcp_server.utils.get_weather_forecast.requests.get") as mock_get:
+        with patch("mcp_server.utils.get_weather_forecast._CLIENT.get") as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = {
                 "daily": {
@@ -72,12 +80,12 @@ class TestWeatherForecastAPI:
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
             
-            result = get_weather_forecast("today", 1)
+            result = await get_weather_forecast("today", 1)
             assert result["days"] == 1
     
-    def test_invalid_date_parsing(self):
+    async def test_invalid_date_parsing(self):
         """Test handling of invalid date formats."""
-        with patch("mcp_server.utils.get_weather_forecast.requests.get") as mock_get:
+        with patch("mcp_server.utils.get_weather_forecast._CLIENT.get") as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = {
                 "daily": {
@@ -95,11 +103,11 @@ class TestWeatherForecastAPI:
             mock_get.return_value = mock_response
             
             # Invalid date should default to today
-            result = get_weather_forecast("invalid-date", 1)
+            result = await get_weather_forecast("invalid-date", 1)
             assert result["days"] == 1
     
-    @patch("mcp_server.utils.get_weather_forecast.requests.get")
-    def test_forecast_date_range(self, mock_get, mock_open_meteo_response):
+    @patch("mcp_server.utils.get_weather_forecast._CLIENT.get")
+    async def test_forecast_date_range(self, mock_get, mock_open_meteo_response):
         """Test forecast retrieval with different date ranges."""
         mock_response = Mock()
         mock_response.json.return_value = mock_open_meteo_response
@@ -107,7 +115,7 @@ class TestWeatherForecastAPI:
         mock_get.return_value = mock_response
         
         # Test 1 day
-        result = get_weather_forecast("2025-01-15", 1)
+        result = await get_weather_forecast("2025-01-15", 1)
         assert result["days"] == 1
         
         # Test 7 days
@@ -126,7 +134,21 @@ class TestWeatherForecastAPI:
             f"2025-01-{15+i}T18:00" for i in range(7)
         ]
         
-        result = get_weather_forecast("2025-01-15", 7)
+        result = await get_weather_forecast("2025-01-15", 7)
         assert result["days"] == 7
         assert len(result["forecast"]) == 7
 
+    @patch("mcp_server.utils.get_weather_forecast._CLIENT.get")
+    async def test_forecast_response_cached(self, mock_get, mock_open_meteo_response):
+        """Test that repeated calls within the TTL reuse the cached response."""
+        mock_response = Mock()
+        mock_response.json.return_value = mock_open_meteo_response
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        first = await get_weather_forecast("2025-01-15", 3)
+        second = await get_weather_forecast("2025-01-15", 3)
+
+        assert second == first
+        mock_get.assert_called_once()
+
@@ -0,0 +1,108 @@
+"""Unit tests for helper utility functions."""
+import pytest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from mcp_server.utils.helpers import (
+    format_date,
+    format_temperature,
+    parse_date_input,
+    validate_days,
+)
+
+DHAKA_TZ = ZoneInfo("Asia/Dhaka")
+
+
+@pytest.mark.unit
+class TestParseDateInput:
+    """Test date input parsing and its fast paths."""
+
+    def test_iso_date(self):
+        """Test parsing an ISO-8601 date string."""
+        dt = parse_date_input("2025-01-15")
+
+        assert dt.year == 2025
+        assert dt.month == 1
+        assert dt.day == 15
+
+    def test_today_keyword(self):
+        """Test that 'today' resolves to the current Cox's Bazar date."""
+        dt = parse_date_input("today")
+
+        assert dt.date() == datetime.now(DHAKA_TZ).date()
+
+    def test_today_case_insensitive(self):
+        """Test that 'Today' is accepted regardless of case."""
+        dt = parse_date_input("Today")
+
+        assert dt.date() == datetime.now(DHAKA_TZ).date()
+
+    def test_non_iso_format(self):
+        """Test parsing a non-ISO format via the strptime fallback."""
+        dt = parse_date_input("15 Jan 2025")
+
+        assert dt.year == 2025
+        assert dt.month == 1
+        assert dt.day == 15
+
+    def test_invalid_date_defaults_to_today(self):
+        """Test that unparseable input falls back to today."""
+        dt = parse_date_input("not-a-date")
+
+        assert dt.date() == datetime.now(DHAKA_TZ).date()
+
+@pytest.mark.unit
+class TestFormatDate:
+    """Test date formatting."""
+
+    def test_iso_date(self):
+        """Test formatting an ISO-8601 date string."""
+        assert format_date("2025-01-15") == "15 Jan 2025"
+
+    def test_today_keyword(self):
+        """Test that 'today' formats to the current Cox's Bazar date."""
+        expected = datetime.now(DHAKA_TZ).strftime("%d %b %Y")
+
+        assert format_date("today") == expected
+
+    def test_invalid_date_defaults_to_today(self):
+        """Test that unparseable input falls back to today."""
+        expected = datetime.now(DHAKA_TZ).strftime("%d %b %Y")
+
+        assert format_date("not-a-date") == expected
+
+@pytest.mark.unit
+class TestFormatTemperature:
+    """Test temperature formatting and its description bands."""
+
+    def test_cool(self):
+        """Test a temperature below the first band boundary."""
+        assert format_temperature(18.0) == "18.0°C (Cool)"
+
+    def test_band_boundaries(self):
+        """Test that band boundaries belong to the warmer band."""
+        assert format_temperature(20.0) == "20.0°C (Pleasant)"
+        assert format_temperature(25.0) == "25.0°C (Warm)"
+        assert format_temperature(30.0) == "30.0°C (Hot)"
+        assert format_temperature(35.0) == "35.0°C (Very Hot)"
+
+    def test_very_hot(self):
+        """Test a temperature above the last band boundary."""
+        assert format_temperature(38.7) == "38.7°C (Very Hot)"
+
+@pytest.mark.unit
+class TestValidateDays:
+    """Test day-count clamping."""
+
+    def test_within_range(self):
+        """Test that an in-range value passes through unchanged."""
+        assert validate_days(7) == 7
+
+    def test_clamps_low(self):
+        """Test that values below 1 clamp to 1."""
+        assert validate_days(0) == 1
+        assert validate_days(-5) == 1
+
+    def test_clamps_high(self):
+        """Test that values above 14 clamp to 14."""
+        assert validate_days(15) == 14
+        assert validate_days(100) == 14